@@ -4,13 +4,16 @@ Application configuration and theme definitions for the Notes Backend.
 This module centralizes FastAPI app metadata, OpenAPI customization, and future
 environment-driven configuration to keep code clean and extensible.
 """
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 import os
 
 
 class Theme(BaseModel):
     """Represents the Ocean Professional theme for docs/UI presentation."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(default="Ocean Professional", description="Theme name")
     description: str = Field(default="Blue & amber accents", description="Theme summary")
     primary: str = Field(default="#2563EB", description="Primary brand color (blue)")
@@ -25,6 +28,8 @@ class Theme(BaseModel):
 
 class AppConfig(BaseModel):
     """Holds application-level settings and OpenAPI metadata."""
+    model_config = ConfigDict(frozen=True)
+
     app_name: str = Field(default="Notes Backend API", description="Human readable app name")
     description: str = Field(
         default=(
@@ -44,9 +49,15 @@ class AppConfig(BaseModel):
         description="Future database URL (provided via env). Not used in mock mode."
     )
 
+    allowed_origins: Tuple[str, ...] = Field(
+        default=("*",),
+        description="CORS allow-list of origins; '*' allows any origin (development default)."
+    )
+
     # PUBLIC_INTERFACE
+    @cached_property
     def openapi_meta(self) -> Dict[str, Any]:
-        """Return the base OpenAPI metadata block for FastAPI app creation."""
+        """Base OpenAPI metadata block for FastAPI app creation (built once)."""
         return {
             "title": self.app_name,
             "description": self.description,
@@ -54,15 +65,23 @@ class AppConfig(BaseModel):
         }
 
 
+def _parse_origins(raw: str) -> Tuple[str, ...]:
+    """Split a comma-separated ALLOWED_ORIGINS value into a tuple of origins."""
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """
     Load the application configuration from environment variables when available.
 
     This function prepares the system for future database integration by
-    reading values from environment variables if provided.
+    reading values from environment variables if provided. The result is
+    cached and frozen, so every caller shares the same instance.
     """
     return AppConfig(
         app_name=os.getenv("APP_NAME", "Notes Backend API"),
         version=os.getenv("APP_VERSION", "1.0.0"),
         database_url=os.getenv("NOTES_DATABASE_URL"),  # For future use
+        allowed_origins=_parse_origins(os.getenv("ALLOWED_ORIGINS", "*")),
     )
@@ -3,17 +3,29 @@ Dependency providers for the FastAPI app.
 
 Currently provides an in-memory notes repository. Future work can add
 a database-backed implementation and switch this provider based on env.
+
+Route handlers read the module-level REPO directly instead of going through
+FastAPI's Depends resolution; use set_notes_repository to swap it (e.g. in tests).
 """
-from typing import Generator
 from .repositories.notes_repository import InMemoryNotesRepository, NotesRepository
 
+# Process-wide repository instance used by the routers
+REPO: NotesRepository = InMemoryNotesRepository()
+
+
+# PUBLIC_INTERFACE
+def get_notes_repository() -> NotesRepository:
+    """
+    Provide the process-wide NotesRepository implementation.
+
+    Per-request resources (e.g. future DB sessions) belong in a separate
+    generator dependency rather than here.
+    """
+    return REPO
+
 
 # PUBLIC_INTERFACE
-def get_notes_repository() -> Generator[NotesRepository, None, None]:
-    """Provide a NotesRepository implementation to route handlers."""
-    repo = InMemoryNotesRepository()
-    try:
-        yield repo
-    finally:
-        # Nothing to cleanup for in-memory; placeholder for real DB sessions
-        pass
+def set_notes_repository(repo: NotesRepository) -> None:
+    """Replace the process-wide NotesRepository used by route handlers."""
+    global REPO
+    REPO = repo
@@ -1,71 +1,102 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from .core.config import load_config
+from .dependencies import get_notes_repository
 from .routers.notes import router as notes_router
 
 config = load_config()
 
+# Tag metadata shown in the OpenAPI docs
+OPENAPI_TAGS = (
+    {
+        "name": "Health",
+        "description": "Service health and metadata endpoints.",
+    },
+    {
+        "name": "Notes",
+        "description": "Create, read, update, and delete notes.",
+    },
+    {
+        "name": "WebSocket",
+        "description": "Real-time features (reserved for future use).",
+    },
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build process-wide state during startup so the first requests don't pay for it.
+
+    Exposes the notes repository singleton on app.state and generates the
+    (cached) OpenAPI schema ahead of the first /docs or /openapi.json hit.
+    """
+    app.state.notes_repo = get_notes_repository()
+    app.openapi_schema = app.openapi()
+    yield
+
+
 app = FastAPI(
-    **config.openapi_meta(),
-    openapi_tags=[
-        {
-            "name": "Health",
-            "description": "Service health and metadata endpoints.",
-        },
-        {
-            "name": "Notes",
-            "description": "Create, read, update, and delete notes.",
-        },
-        {
-            "name": "WebSocket",
-            "description": "Real-time features (reserved for future use).",
-        },
-    ],
+    **config.openapi_meta,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    openapi_tags=list(OPENAPI_TAGS),
 )
 
-# Allow all origins during development; restrict for prod as needed
+# Origins come from ALLOWED_ORIGINS (defaults to "*" for development); set a
+# concrete comma-separated list in production
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(config.allowed_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
 
+# Docs UI theming extension, built once from the loaded config
+X_THEME = {
+    "name": config.theme.name,
+    "palette": {
+        "primary": config.theme.primary,
+        "secondary": config.theme.secondary,
+        "success": config.theme.success,
+        "error": config.theme.error,
+        "background": config.theme.background,
+        "surface": config.theme.surface,
+        "text": config.theme.text,
+        "gradient": config.theme.gradient,
+    },
+    "style": "Modern",
+    "notes": "Clean layout, subtle shadows, rounded corners, minimalist design."
+}
+
+
+@lru_cache(maxsize=1)
 def custom_openapi():
     """
     Customize OpenAPI schema metadata and inject Ocean Professional theme hints.
+
+    The schema is generated on first use and cached for the process lifetime.
     """
-    if app.openapi_schema:
-        return app.openapi_schema
     openapi_schema = get_openapi(
         title=config.app_name,
         version=config.version,
         description=config.description,
         routes=app.routes,
+        tags=app.openapi_tags,
     )
     # Add custom extensions for docs UI theming (consumed by external renderers if supported)
-    openapi_schema["x-theme"] = {
-        "name": config.theme.name,
-        "palette": {
-            "primary": config.theme.primary,
-            "secondary": config.theme.secondary,
-            "success": config.theme.success,
-            "error": config.theme.error,
-            "background": config.theme.background,
-            "surface": config.theme.surface,
-            "text": config.theme.text,
-            "gradient": config.theme.gradient,
-        },
-        "style": "Modern",
-        "notes": "Clean layout, subtle shadows, rounded corners, minimalist design."
-    }
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
+    openapi_schema["x-theme"] = X_THEME
+    return openapi_schema
 
 
 app.openapi = custom_openapi
@@ -74,6 +105,34 @@ app.openapi = custom_openapi
 app.include_router(notes_router)
 
 
+# Static payloads for the Health endpoints, serialized once at import time
+_HEALTH_BODY = orjson.dumps(
+    {"status": "ok", "service": config.app_name, "version": config.version}
+)
+_USAGE_BODY = orjson.dumps(
+    {
+        "theme": {
+            "name": config.theme.name,
+            "primary": config.theme.primary,
+            "secondary": config.theme.secondary,
+        },
+        "rest_endpoints": {
+            "list": "GET /notes",
+            "create": "POST /notes",
+            "create_batch": "POST /notes/batch",
+            "get": "GET /notes/{note_id}",
+            "update": "PUT /notes/{note_id}",
+            "delete": "DELETE /notes/{note_id}",
+        },
+        "realtime": {
+            "planned": True,
+            "websocket_endpoint": "/ws/notes",
+            "note": "WebSocket endpoints are not implemented yet; reserved for future."
+        },
+    }
+)
+
+
 # PUBLIC_INTERFACE
 @app.get(
     "/",
@@ -84,7 +143,7 @@ app.include_router(notes_router)
 )
 def health_check():
     """Return a simple health status payload."""
-    return {"status": "ok", "service": config.app_name, "version": config.version}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # PUBLIC_INTERFACE
@@ -102,24 +161,4 @@ def health_check():
 )
 def get_usage_info():
     """Provide human-readable usage notes and future WebSocket guidance."""
-    return JSONResponse(
-        {
-            "theme": {
-                "name": config.theme.name,
-                "primary": config.theme.primary,
-                "secondary": config.theme.secondary,
-            },
-            "rest_endpoints": {
-                "list": "GET /notes",
-                "create": "POST /notes",
-                "get": "GET /notes/{note_id}",
-                "update": "PUT /notes/{note_id}",
-                "delete": "DELETE /notes/{note_id}",
-            },
-            "realtime": {
-                "planned": True,
-                "websocket_endpoint": "/ws/notes",
-                "note": "WebSocket endpoints are not implemented yet; reserved for future."
-            },
-        }
-    )
+    return Response(content=_USAGE_BODY, media_type="application/json")
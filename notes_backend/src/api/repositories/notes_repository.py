@@ -7,91 +7,226 @@ swapping the repository implementation without changing the routers.
 """
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
-from datetime import datetime, timezone
-import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+from datetime import datetime, timedelta, timezone
+import base64
+import time
 
 from ..models.schemas import Note, NoteCreate, NoteUpdate
 
 
-class NotesRepository(ABC):
-    """Repository interface for notes persistence."""
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _now() -> int:
+    """Return the current time as integer nanoseconds since the Unix epoch."""
+    return time.time_ns()
+
+
+def _to_datetime(ns: int) -> datetime:
+    """Convert epoch nanoseconds to an aware UTC datetime (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _encode_id(key: int) -> str:
+    """Encode an internal integer key as its short, URL-safe external note ID."""
+    return base64.urlsafe_b64encode(key.to_bytes(8, "big")).rstrip(b"=").decode("ascii")
+
+
+def _decode_id(note_id: str) -> Optional[int]:
+    """Parse an external note ID back to its integer key, or None if it is malformed."""
+    if len(note_id) != 11:
+        return None
+    try:
+        key = int.from_bytes(base64.b64decode(note_id + "=", altchars=b"-_", validate=True), "big")
+    except ValueError:
+        return None
+    # Reject non-canonical spellings (unused trailing bits set) so each note has one ID
+    return key if _encode_id(key) == note_id else None
+
+
+class NotesRepository(Protocol):
+    """Repository interface for notes persistence (structural; implementations need not subclass)."""
 
     # PUBLIC_INTERFACE
-    @abstractmethod
     def list_notes(self) -> List[Note]:
         """List all notes, most recently updated first."""
-        raise NotImplementedError
+        ...
+
+    # PUBLIC_INTERFACE
+    def iter_notes_as_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield all notes as plain dicts (same order as list_notes), ready for JSON encoding."""
+        ...
+
+    # PUBLIC_INTERFACE
+    def version(self) -> int:
+        """Return a counter that increases whenever the set of notes changes."""
+        ...
 
     # PUBLIC_INTERFACE
-    @abstractmethod
     def get_note(self, note_id: str) -> Optional[Note]:
         """Retrieve a note by its ID or return None if not found."""
-        raise NotImplementedError
+        ...
 
     # PUBLIC_INTERFACE
-    @abstractmethod
-    def create_note(self, payload: NoteCreate) -> Note:
-        """Create and persist a new note from the provided payload."""
-        raise NotImplementedError
+    def create_note(self, payload: NoteCreate, now: Optional[int] = None) -> Note:
+        """
+        Create and persist a new note from the provided payload.
+
+        `now` (epoch ns), when given, is used for both timestamps instead of reading the clock.
+        """
+        ...
 
     # PUBLIC_INTERFACE
-    @abstractmethod
-    def update_note(self, note_id: str, payload: NoteUpdate) -> Optional[Note]:
-        """Update a note by ID with provided fields. Returns updated note or None if not found."""
-        raise NotImplementedError
+    def create_notes(self, payloads: List[NoteCreate], now: Optional[int] = None) -> List[Note]:
+        """
+        Create and persist several notes at once, in the given order.
+
+        All notes share one timestamp (`now`, epoch ns, or the current time).
+        """
+        ...
+
+    # PUBLIC_INTERFACE
+    def update_note(self, note_id: str, payload: NoteUpdate, now: Optional[int] = None) -> Optional[Note]:
+        """
+        Update a note by ID with provided fields. Returns updated note or None if not found.
+
+        `now` (epoch ns), when given, is used as the new updated_at instead of reading the clock.
+        """
+        ...
 
     # PUBLIC_INTERFACE
-    @abstractmethod
     def delete_note(self, note_id: str) -> bool:
         """Delete a note by ID. Returns True if deleted, False if not found."""
-        raise NotImplementedError
+        ...
 
 
-class InMemoryNotesRepository(NotesRepository):
+class InMemoryNotesRepository:
     """
-    Simple in-memory repository backed by a dict.
+    Simple in-memory repository using a structure-of-arrays layout.
 
     Notes:
     - Not suitable for production; intended as a mock/stub for early development.
-    - Provides deterministic ordering by updated_at descending.
+    - Each note field lives in its own dict keyed by an internal integer key;
+      Note models are assembled on read.
+    - Keys are allocated sequentially and exposed to clients as 11-character
+      URL-safe base64 IDs (see _encode_id / _decode_id).
+    - Timestamps are stored as epoch nanoseconds and converted to datetimes only
+      when a note is read.
+    - Provides deterministic ordering by updated_at descending. _updated is kept
+      in update order (least recent first), so listing needs no sort.
+    - version() starts from the construction time in ns so values are not reused
+      across process restarts.
     """
     def __init__(self) -> None:
-        self._store: Dict[str, Note] = {}
+        self._next_key: int = 0
+        self._ids: Dict[int, str] = {}
+        self._title: Dict[int, str] = {}
+        self._content: Dict[int, str] = {}
+        self._tags: Dict[int, Optional[List[str]]] = {}
+        self._created: Dict[int, int] = {}
+        self._updated: OrderedDict[int, int] = OrderedDict()
+        self._version: int = time.time_ns()
+
+    def _as_dict(self, key: int) -> Dict[str, Any]:
+        return {
+            "title": self._title[key],
+            "content": self._content[key],
+            "tags": self._tags[key],
+            "id": self._ids[key],
+            "created_at": _to_datetime(self._created[key]),
+            "updated_at": _to_datetime(self._updated[key]),
+        }
+
+    def _to_note(self, key: int) -> Note:
+        # Stored fields were validated on the way in; skip re-validation
+        return Note.model_construct(**self._as_dict(key))
+
+    def _lookup(self, note_id: str) -> Optional[int]:
+        key = _decode_id(note_id)
+        return key if key in self._updated else None
 
     def list_notes(self) -> List[Note]:
-        return sorted(self._store.values(), key=lambda n: n.updated_at, reverse=True)
+        return [self._to_note(key) for key in reversed(self._updated)]
+
+    def iter_notes_as_dicts(self) -> Iterator[Dict[str, Any]]:
+        # Snapshot the order so writes made while a response streams can't break iteration
+        for key in list(reversed(self._updated)):
+            try:
+                yield self._as_dict(key)
+            except KeyError:
+                # Deleted after the snapshot was taken
+                continue
+
+    def version(self) -> int:
+        return self._version
 
     def get_note(self, note_id: str) -> Optional[Note]:
-        return self._store.get(note_id)
-
-    def create_note(self, payload: NoteCreate) -> Note:
-        now = datetime.now(timezone.utc)
-        note_id = uuid.uuid4().hex
-        note = Note(
-            id=note_id,
-            title=payload.title,
-            content=payload.content,
-            tags=payload.tags,
-            created_at=now,
-            updated_at=now,
-        )
-        self._store[note_id] = note
-        return note
-
-    def update_note(self, note_id: str, payload: NoteUpdate) -> Optional[Note]:
-        existing = self._store.get(note_id)
-        if not existing:
+        key = self._lookup(note_id)
+        if key is None:
+            return None
+        return self._to_note(key)
+
+    def create_note(self, payload: NoteCreate, now: Optional[int] = None) -> Note:
+        if now is None:
+            now = _now()
+        key = self._next_key
+        self._next_key += 1
+        # The payload was validated as NoteCreate at the API boundary; trust it here
+        self._ids[key] = _encode_id(key)
+        self._title[key] = payload.title
+        self._content[key] = payload.content
+        self._tags[key] = payload.tags
+        self._created[key] = now
+        self._updated[key] = now
+        self._version += 1
+        return self._to_note(key)
+
+    def create_notes(self, payloads: List[NoteCreate], now: Optional[int] = None) -> List[Note]:
+        if now is None:
+            now = _now()
+        keys = range(self._next_key, self._next_key + len(payloads))
+        self._next_key += len(payloads)
+        self._ids.update((key, _encode_id(key)) for key in keys)
+        self._title.update(zip(keys, (p.title for p in payloads)))
+        self._content.update(zip(keys, (p.content for p in payloads)))
+        self._tags.update(zip(keys, (p.tags for p in payloads)))
+        self._created.update(dict.fromkeys(keys, now))
+        self._updated.update(dict.fromkeys(keys, now))
+        if payloads:
+            self._version += 1
+        return [self._to_note(key) for key in keys]
+
+    def update_note(self, note_id: str, payload: NoteUpdate, now: Optional[int] = None) -> Optional[Note]:
+        key = self._lookup(note_id)
+        if key is None:
             return None
-        updated = existing.model_copy(update={
-            "title": payload.title if payload.title is not None else existing.title,
-            "content": payload.content if payload.content is not None else existing.content,
-            "tags": payload.tags if payload.tags is not None else existing.tags,
-            "updated_at": datetime.now(timezone.utc),
-        })
-        self._store[note_id] = updated
-        return updated
+        if payload.title is None and payload.content is None and payload.tags is None:
+            # Nothing to change: leave updated_at and ordering untouched
+            return self._to_note(key)
+        if now is None:
+            now = _now()
+        if payload.title is not None:
+            self._title[key] = payload.title
+        if payload.content is not None:
+            self._content[key] = payload.content
+        if payload.tags is not None:
+            self._tags[key] = payload.tags
+        self._updated[key] = now
+        self._updated.move_to_end(key, last=True)
+        self._version += 1
+        return self._to_note(key)
 
     def delete_note(self, note_id: str) -> bool:
-        return self._store.pop(note_id, None) is not None
+        key = self._lookup(note_id)
+        if key is None:
+            return False
+        del self._updated[key]
+        del self._ids[key]
+        del self._title[key]
+        del self._content[key]
+        del self._tags[key]
+        del self._created[key]
+        self._version += 1
+        return True
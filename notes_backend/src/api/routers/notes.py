@@ -1,12 +1,90 @@
 """
 Notes router providing RESTful CRUD operations.
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List
 
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from .. import dependencies
 from ..models.schemas import Note, NoteCreate, NoteUpdate
-from ..repositories.notes_repository import NotesRepository
-from ..dependencies import get_notes_repository
+
+
+class _NotesJSONResponse(ORJSONResponse):
+    """ORJSONResponse that renders UTC datetimes with a 'Z' suffix, matching Pydantic output."""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _note_etag(note: Note) -> str:
+    """Weak ETag for a single note, derived from its updated_at (in microseconds)."""
+    return f'W/"{(note.updated_at - _EPOCH) // timedelta(microseconds=1)}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
+
+
+# Rows serialized per chunk when streaming the notes list
+_STREAM_CHUNK_ROWS = 256
+
+
+def _stream_notes_json(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode rows as a JSON array incrementally, yielding one chunk per _STREAM_CHUNK_ROWS rows."""
+    yield b"["
+    chunk: List[bytes] = []
+    first = True
+    for row in rows:
+        chunk.append(orjson.dumps(row, option=orjson.OPT_UTC_Z))
+        if len(chunk) == _STREAM_CHUNK_ROWS:
+            yield (b"" if first else b",") + b",".join(chunk)
+            chunk.clear()
+            first = False
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]"
+
+
+# OpenAPI response docs per route, built once at import
+_NOT_FOUND = {404: {"description": "Note not found."}}
+_VALIDATION_ERROR = {422: {"description": "Validation error."}}
+
+_LIST_NOTES_RESPONSES = {
+    200: {"model": List[Note], "description": "List of notes successfully retrieved."},
+    304: {"description": "List unchanged since the ETag given in If-None-Match."},
+}
+_CREATE_NOTE_RESPONSES = {
+    201: {"model": Note, "description": "Note created successfully."},
+    **_VALIDATION_ERROR,
+}
+_CREATE_NOTES_RESPONSES = {
+    201: {"model": List[Note], "description": "Notes created successfully."},
+    **_VALIDATION_ERROR,
+}
+_GET_NOTE_RESPONSES = {
+    200: {"model": Note, "description": "Note found and returned."},
+    304: {"description": "Note unchanged since the ETag given in If-None-Match."},
+    **_NOT_FOUND,
+}
+_UPDATE_NOTE_RESPONSES = {
+    200: {"model": Note, "description": "Note updated successfully."},
+    **_NOT_FOUND,
+}
+_DELETE_NOTE_RESPONSES = {
+    204: {"description": "Note deleted successfully."},
+    **_NOT_FOUND,
+}
 
 router = APIRouter(
     prefix="/notes",
@@ -17,71 +95,91 @@ router = APIRouter(
 # PUBLIC_INTERFACE
 @router.get(
     "",
-    response_model=List[Note],
+    response_model=None,
     summary="List notes",
     description="Retrieve all notes ordered by last update time (descending).",
-    responses={
-        200: {"description": "List of notes successfully retrieved."}
-    },
+    responses=_LIST_NOTES_RESPONSES,
 )
-def list_notes(repo: NotesRepository = Depends(get_notes_repository)) -> List[Note]:
-    """Return the list of all notes."""
-    return repo.list_notes()
+def list_notes(request: Request) -> Response:
+    """
+    Return the list of all notes, streamed as a JSON array straight from repository storage.
+
+    Replies 304 Not Modified when If-None-Match matches the current list ETag.
+    """
+    repo = dependencies.REPO
+    etag = f'W/"{repo.version()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return StreamingResponse(
+        _stream_notes_json(repo.iter_notes_as_dicts()),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 # PUBLIC_INTERFACE
 @router.post(
     "",
-    response_model=Note,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
     summary="Create a note",
     description="Create and return a new note using the provided title, content, and optional tags.",
-    responses={
-        201: {"description": "Note created successfully."},
-        422: {"description": "Validation error."}
-    },
+    responses=_CREATE_NOTE_RESPONSES,
 )
-def create_note(payload: NoteCreate, repo: NotesRepository = Depends(get_notes_repository)) -> Note:
+def create_note(payload: NoteCreate) -> ORJSONResponse:
     """Create a new note."""
-    return repo.create_note(payload)
+    note = dependencies.REPO.create_note(payload)
+    return _NotesJSONResponse(note.model_dump(), status_code=status.HTTP_201_CREATED)
+
+
+# PUBLIC_INTERFACE
+@router.post(
+    "/batch",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create notes in bulk",
+    description="Create several notes in one request. Notes are created in the order given and share one timestamp.",
+    responses=_CREATE_NOTES_RESPONSES,
+)
+def create_notes(payloads: List[NoteCreate]) -> ORJSONResponse:
+    """Create multiple notes at once."""
+    notes = dependencies.REPO.create_notes(payloads)
+    return _NotesJSONResponse([note.model_dump() for note in notes], status_code=status.HTTP_201_CREATED)
 
 
 # PUBLIC_INTERFACE
 @router.get(
     "/{note_id}",
-    response_model=Note,
+    response_model=None,
     summary="Get a note",
     description="Retrieve a note by its unique identifier.",
-    responses={
-        200: {"description": "Note found and returned."},
-        404: {"description": "Note not found."}
-    },
+    responses=_GET_NOTE_RESPONSES,
 )
-def get_note(note_id: str, repo: NotesRepository = Depends(get_notes_repository)) -> Note:
-    """Retrieve a single note by ID."""
-    note = repo.get_note(note_id)
+def get_note(note_id: str, request: Request) -> Response:
+    """Retrieve a single note by ID, replying 304 when If-None-Match matches its ETag."""
+    note = dependencies.REPO.get_note(note_id)
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-    return note
+    etag = _note_etag(note)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return _NotesJSONResponse(note.model_dump(), headers={"ETag": etag})
 
 
 # PUBLIC_INTERFACE
 @router.put(
     "/{note_id}",
-    response_model=Note,
+    response_model=None,
     summary="Update a note",
     description="Replace fields of a note by its ID. Partial updates are supported; only provided fields are changed.",
-    responses={
-        200: {"description": "Note updated successfully."},
-        404: {"description": "Note not found."}
-    },
+    responses=_UPDATE_NOTE_RESPONSES,
 )
-def update_note(note_id: str, payload: NoteUpdate, repo: NotesRepository = Depends(get_notes_repository)) -> Note:
+def update_note(note_id: str, payload: NoteUpdate) -> ORJSONResponse:
     """Update a note by ID."""
-    updated = repo.update_note(note_id, payload)
+    updated = dependencies.REPO.update_note(note_id, payload)
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-    return updated
+    return _NotesJSONResponse(updated.model_dump())
 
 
 # PUBLIC_INTERFACE
@@ -90,14 +188,11 @@ def update_note(note_id: str, payload: NoteUpdate, repo: NotesRepository = Depen
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a note",
     description="Delete a note by its unique identifier.",
-    responses={
-        204: {"description": "Note deleted successfully."},
-        404: {"description": "Note not found."}
-    },
+    responses=_DELETE_NOTE_RESPONSES,
 )
-def delete_note(note_id: str, repo: NotesRepository = Depends(get_notes_repository)) -> None:
+def delete_note(note_id: str) -> None:
     """Delete a note by ID."""
-    deleted = repo.delete_note(note_id)
+    deleted = dependencies.REPO.delete_note(note_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
     return None